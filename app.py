@@ -1,9 +1,9 @@
 import streamlit as st
-import plotly.express as px
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
+import altair as alt
 from calculations import MutualFundCalculator
 import pandas as pd
+import numpy as np
+import pyarrow as pa
 
 # Page configuration
 st.set_page_config(
@@ -15,6 +15,51 @@ st.set_page_config(
 # Initialize calculator
 calc = MutualFundCalculator()
 
+# Session state defaults - the inputs behind each calculator's stored results (None until calculated)
+for key in ('oti_inputs', 'sip_inputs', 'swp_inputs'):
+    st.session_state.setdefault(key, None)
+
+# Cached calculator wrappers - identical inputs are served from Streamlit's memo store
+@st.cache_data(show_spinner=False)
+def _cached_oti(principal, rate, years, inflation_rate, enable_increase, increase_frequency, increase_amount):
+    """Memoized one-time investment calculation"""
+    return calc.one_time_investment(
+        principal=principal,
+        rate=rate,
+        years=years,
+        inflation_rate=inflation_rate,
+        enable_increase=enable_increase,
+        increase_frequency=increase_frequency,
+        increase_amount=increase_amount
+    )
+
+@st.cache_data(show_spinner=False)
+def _cached_sip(monthly_investment, rate, years, inflation_rate, enable_increase, increase_frequency, increase_percentage):
+    """Memoized SIP calculation"""
+    return calc.sip_calculator(
+        monthly_investment=monthly_investment,
+        rate=rate,
+        years=years,
+        inflation_rate=inflation_rate,
+        enable_increase=enable_increase,
+        increase_frequency=increase_frequency,
+        increase_percentage=increase_percentage
+    )
+
+@st.cache_data(show_spinner=False)
+def _cached_swp(initial_amount, withdrawal_amount, rate, years, inflation_rate, enable_increase, increase_frequency, increase_percentage):
+    """Memoized SWP calculation"""
+    return calc.swp_calculator(
+        initial_amount=initial_amount,
+        withdrawal_amount=withdrawal_amount,
+        rate=rate,
+        years=years,
+        inflation_rate=inflation_rate,
+        enable_increase=enable_increase,
+        increase_frequency=increase_frequency,
+        increase_percentage=increase_percentage
+    )
+
 # Main title
 st.title("🏦 Mutual Fund Investment Calculator")
 st.markdown("---")
@@ -23,58 +68,99 @@ st.markdown("---")
 st.sidebar.title("Select Calculator")
 calculator_type = st.sidebar.selectbox(
     "Choose Calculator Type:",
-    ["One Time Investment", "SIP Calculator", "SWP Calculator"]
+    ["One Time Investment", "SIP Calculator", "SWP Calculator"],
+    key="calculator_type"
 )
 
 st.sidebar.markdown("---")
 
-# Optional Settings
-with st.sidebar.expander("Optional: Adjust Inflation & CAGR"):
-    enable_inflation = st.checkbox("Enable inflation adjustment", value=False)
-    inflation_rate = st.number_input("Inflation rate (% per year)", min_value=0.0, max_value=20.0, value=6.0, step=0.25, disabled=not enable_inflation)
-
-with st.sidebar.expander("Optional: Step-up Investment/Withdrawal", expanded=False):
-    enable_increase = st.checkbox("Enable step-up / periodic increase", value=False)
-    increase_frequency = st.selectbox("Increase frequency", ["Yearly", "Every 3 years", "Every 5 years"], index=0, disabled=not enable_increase)
-
-    # Different controls for SIP/SWP vs One-time
-    if calculator_type == "SIP Calculator":
-        increase_percentage = st.number_input("Increase SIP by (%) when frequency triggers", min_value=0.0, max_value=200.0, value=10.0, step=1.0, disabled=not enable_increase)
-        increase_amount = None
-    elif calculator_type == "SWP Calculator":
-        increase_percentage = st.number_input("Increase Withdrawal by (%) when frequency triggers", min_value=0.0, max_value=200.0, value=10.0, step=1.0, disabled=not enable_increase)
-        increase_amount = None
-    else:  # One-time
-        increase_percentage = None
-        increase_amount = st.number_input("Additional one-time contribution (₹) when frequency triggers", min_value=0, max_value=1_00_00_000, value=50000, step=1_000, disabled=not enable_increase)
+# Optional Settings - plain sidebar widgets, so changing one reruns the whole page.
+# Calculator sections read the values back from st.session_state via the widget keys.
+with st.sidebar:
+    with st.expander("Optional: Adjust Inflation & CAGR"):
+        enable_inflation = st.checkbox("Enable inflation adjustment", value=False, key="enable_inflation")
+        st.number_input("Inflation rate (% per year)", min_value=0.0, max_value=20.0, value=6.0, step=0.25, disabled=not enable_inflation, key="inflation_rate")
+
+    with st.expander("Optional: Step-up Investment/Withdrawal", expanded=False):
+        enable_increase = st.checkbox("Enable step-up / periodic increase", value=False, key="enable_increase")
+        st.selectbox("Increase frequency", ["Yearly", "Every 3 years", "Every 5 years"], index=0, disabled=not enable_increase, key="increase_frequency")
+
+        # Different controls for SIP/SWP vs One-time
+        if calculator_type == "SIP Calculator":
+            st.number_input("Increase SIP by (%) when frequency triggers", min_value=0.0, max_value=200.0, value=10.0, step=1.0, disabled=not enable_increase, key="increase_percentage")
+        elif calculator_type == "SWP Calculator":
+            st.number_input("Increase Withdrawal by (%) when frequency triggers", min_value=0.0, max_value=200.0, value=10.0, step=1.0, disabled=not enable_increase, key="increase_percentage")
+        else:  # One-time
+            st.number_input("Additional one-time contribution (₹) when frequency triggers", min_value=0, max_value=1_00_00_000, value=50000, step=1_000, disabled=not enable_increase, key="increase_amount")
+
+# Table formatting - applied client-side by st.dataframe
+_CURRENCY_FORMAT = st.column_config.NumberColumn(format="₹%,d")
+_PERCENT_FORMAT = st.column_config.NumberColumn(format="%.2f%%")
+_TABLE_COLUMN_CONFIG = {
+    "Total Principal": _CURRENCY_FORMAT,
+    "Additional Investment": _CURRENCY_FORMAT,
+    "Monthly SIP": _CURRENCY_FORMAT,
+    "Annual Investment": _CURRENCY_FORMAT,
+    "Total Invested": _CURRENCY_FORMAT,
+    "Final Amount": _CURRENCY_FORMAT,
+    "Interest Earned": _CURRENCY_FORMAT,
+    "Gains": _CURRENCY_FORMAT,
+    "Monthly Withdrawal": _CURRENCY_FORMAT,
+    "Annual Withdrawn": _CURRENCY_FORMAT,
+    "Remaining Balance": _CURRENCY_FORMAT,
+    "Total Withdrawn": _CURRENCY_FORMAT,
+    "Real Value (Inflation Adjusted)": _CURRENCY_FORMAT,
+    "Real Balance (Inflation Adjusted)": _CURRENCY_FORMAT,
+    "Interest Percent": _PERCENT_FORMAT,
+    "Gains Percent": _PERCENT_FORMAT,
+}
+
+# Growth chart layout - built once and shared by every chart
+_GROWTH_X = alt.X('Year:Q', title='Year', axis=alt.Axis(format='d'))
+_GROWTH_Y = alt.Y('Amount:Q', title='Amount (₹)')
+_GROWTH_LEGEND = alt.Legend(orient='top')
+_GROWTH_TOOLTIP = ['Year:Q', 'Series:N', alt.Tooltip('Formatted Amount:N', title='Amount')]
+_GROWTH_HEIGHT = 500
 
 # Helper functions
 def pretty_num(n):
     """Format number as currency"""
     return f"₹{int(n):,}"
 
+def format_currency(amounts):
+    """Format amounts in crore / lakh / rupee units, formatting each value once (NaN -> "")"""
+    return [
+        "" if value != value  # NaN
+        else f"₹{value / 1e7:.2f} Cr" if value >= 1e7
+        else f"₹{value / 1e5:.2f} L" if value >= 1e5
+        else pretty_num(value)
+        for value in np.asarray(amounts, dtype=float).tolist()
+    ]
+
+@st.cache_data(show_spinner=False)
+def _cached_growth_spec(year_tuple, value_tuples, col_names, title):
+    """Build the growth chart as a serialized Vega-Lite spec, reused while the plotted data is unchanged"""
+    chart_df = pd.DataFrame(dict(zip(col_names, value_tuples)), index=pd.Index(year_tuple, name='Year'))
+    long_df = chart_df.reset_index().melt('Year', var_name='Series', value_name='Amount')
+    long_df['Formatted Amount'] = format_currency(long_df['Amount'])
+
+    return alt.Chart(long_df, title=title).mark_line(point=True, strokeWidth=3).encode(
+        x=_GROWTH_X,
+        y=_GROWTH_Y,
+        color=alt.Color('Series:N', title=None, sort=list(col_names), legend=_GROWTH_LEGEND),
+        tooltip=_GROWTH_TOOLTIP
+    ).properties(height=_GROWTH_HEIGHT).to_dict()
+
 def create_growth_chart(df, y_cols, title):
     """Create interactive growth chart"""
-    fig = go.Figure()
-    for col in y_cols:
-        if col in df.columns and df[col].notna().any():
-            fig.add_trace(go.Scatter(
-                x=df['Year'], 
-                y=df[col], 
-                mode='lines+markers', 
-                name=col,
-                line=dict(width=3)
-            ))
-
-    fig.update_layout(
-        title=title,
-        xaxis_title='Year',
-        yaxis_title='Amount (₹)',
-        template='plotly_white',
-        legend=dict(orientation='h', yanchor="bottom", y=1.02, xanchor="right", x=1),
-        height=500
+    # Series are either fully populated or all None (inflation off), so the last row decides
+    col_names = tuple(col for col in y_cols if col in df.columns and pd.notna(df[col].iat[-1]))
+    return _cached_growth_spec(
+        tuple(df['Year']),
+        tuple(tuple(df[col]) for col in col_names),
+        col_names,
+        title
     )
-    return fig
 
 def investment_summary_block(df, calculator_type):
     """Display investment summary for the final year"""
@@ -91,14 +177,10 @@ def investment_summary_block(df, calculator_type):
         interest_earned = summary_row.get('Interest Earned', 0)
         interest_percent = summary_row.get('Interest Percent', 0)
 
-        with col1:
-            st.metric("Final Amount", pretty_num(final_amount))
-        with col2:
-            st.metric("Total Principal", pretty_num(total_principal))
-        with col3:
-            st.metric("Interest Earned", pretty_num(interest_earned))
-        with col4:
-            st.metric("Interest %", f"{interest_percent:.1f}%")
+        col1.metric("Final Amount", pretty_num(final_amount))
+        col2.metric("Total Principal", pretty_num(total_principal))
+        col3.metric("Interest Earned", pretty_num(interest_earned))
+        col4.metric("Interest %", f"{interest_percent:.1f}%")
 
     elif calculator_type == "SIP Calculator":
         final_amount = summary_row.get('Final Amount', 0)
@@ -106,31 +188,23 @@ def investment_summary_block(df, calculator_type):
         gains = summary_row.get('Gains', 0)
         gains_percent = summary_row.get('Gains Percent', 0)
 
-        with col1:
-            st.metric("Final Amount", pretty_num(final_amount))
-        with col2:
-            st.metric("Total Invested", pretty_num(total_invested))
-        with col3:
-            st.metric("Total Gains", pretty_num(gains))
-        with col4:
-            st.metric("Gains %", f"{gains_percent:.1f}%")
+        col1.metric("Final Amount", pretty_num(final_amount))
+        col2.metric("Total Invested", pretty_num(total_invested))
+        col3.metric("Total Gains", pretty_num(gains))
+        col4.metric("Gains %", f"{gains_percent:.1f}%")
 
     else:  # SWP Calculator
         remaining_balance = summary_row.get('Remaining Balance', 0)
         total_withdrawn = summary_row.get('Total Withdrawn', 0)
         monthly_withdrawal = summary_row.get('Monthly Withdrawal', 0)
 
-        with col1:
-            st.metric("Remaining Balance", pretty_num(remaining_balance))
-        with col2:
-            st.metric("Total Withdrawn", pretty_num(total_withdrawn))
-        with col3:
-            st.metric("Monthly Withdrawal", pretty_num(monthly_withdrawal))
-        with col4:
-            st.metric("Years Completed", f"{len(df)}")
+        col1.metric("Remaining Balance", pretty_num(remaining_balance))
+        col2.metric("Total Withdrawn", pretty_num(total_withdrawn))
+        col3.metric("Monthly Withdrawal", pretty_num(monthly_withdrawal))
+        col4.metric("Years Completed", f"{len(df)}")
 
     # Real value if inflation is considered and enabled
-    if enable_inflation:
+    if st.session_state.enable_inflation:
         if 'Real Value (Inflation Adjusted)' in summary_row and pd.notnull(summary_row['Real Value (Inflation Adjusted)']):
             st.info(f"💡 **Real Value (Inflation Adjusted):** {pretty_num(summary_row['Real Value (Inflation Adjusted)'])}")
         elif 'Real Balance (Inflation Adjusted)' in summary_row and pd.notnull(summary_row['Real Balance (Inflation Adjusted)']):
@@ -140,7 +214,14 @@ def investment_summary_block(df, calculator_type):
 
 
 # Main calculator sections
-if calculator_type == "One Time Investment":
+@st.fragment
+def _oti_fragment():
+    """One-time investment inputs, results and charts"""
+    enable_inflation = st.session_state.enable_inflation
+    inflation_rate = st.session_state.inflation_rate
+    enable_increase = st.session_state.enable_increase
+    increase_frequency = st.session_state.increase_frequency
+
     st.subheader("💰 One Time Investment Calculator")
 
     col1, col2, col3 = st.columns(3)
@@ -151,27 +232,38 @@ if calculator_type == "One Time Investment":
     with col3:
         years = st.number_input("Investment Duration (years)", min_value=1, max_value=60, value=15, step=1)
 
+    # Everything the results depend on - stored results are shown only while these are unchanged
+    inputs = dict(
+        principal=int(principal),
+        rate=float(rate),
+        years=int(years),
+        inflation_rate=float(inflation_rate),
+        enable_increase=bool(enable_increase),
+        increase_frequency=increase_frequency,
+        increase_amount=float(st.session_state.increase_amount)
+    )
+
     if st.button("Calculate", type="primary", use_container_width=False):
         # Calculate with new parameters
-        df = calc.one_time_investment(
-            principal=int(principal), 
-            rate=float(rate), 
-            years=int(years),
-            inflation_rate=float(inflation_rate),
-            enable_increase=bool(enable_increase),
-            increase_frequency=increase_frequency,
-            increase_amount=float(increase_amount) if increase_amount is not None else 0.0
-        )
+        df = _cached_oti(**inputs)
+
+        # Keep the results, and their Arrow form for st.dataframe, across reruns
+        st.session_state.oti_df = df
+        st.session_state.oti_arrow = pa.Table.from_pandas(df, preserve_index=False)
+        st.session_state.oti_inputs = inputs
+
+    if st.session_state.oti_inputs == inputs:
+        df = st.session_state.oti_df
 
         # 1. Display summary
-        investment_summary_block(df, calculator_type)
+        investment_summary_block(df, st.session_state.calculator_type)
 
         # 2. Display growth chart
         chart_cols = ["Final Amount", "Total Principal"]
         if enable_inflation and inflation_rate > 0:
             chart_cols.append("Real Value (Inflation Adjusted)")
 
-        st.plotly_chart(
+        st.vega_lite_chart(
             create_growth_chart(
                 df, 
                 chart_cols, 
@@ -183,13 +275,20 @@ if calculator_type == "One Time Investment":
         # 3. Display data table
         st.subheader("📈 Year-wise Growth Details")
         # Remove the index column for cleaner display
-        df_display = df.copy()
+        table = st.session_state.oti_arrow
         if not enable_inflation:
-            df_display = df_display.drop(columns=["Real Value (Inflation Adjusted)"], errors="ignore")
-        st.dataframe(df_display, use_container_width=True, hide_index=True)
+            table = table.select([col for col in table.column_names if col != "Real Value (Inflation Adjusted)"])
+        st.dataframe(table, use_container_width=True, hide_index=True, column_config=_TABLE_COLUMN_CONFIG)
 
 
-elif calculator_type == "SIP Calculator":
+@st.fragment
+def _sip_fragment():
+    """SIP inputs, results and charts"""
+    enable_inflation = st.session_state.enable_inflation
+    inflation_rate = st.session_state.inflation_rate
+    enable_increase = st.session_state.enable_increase
+    increase_frequency = st.session_state.increase_frequency
+
     st.subheader("📈 SIP (Systematic Investment Plan) Calculator")
 
     col1, col2, col3 = st.columns(3)
@@ -200,27 +299,38 @@ elif calculator_type == "SIP Calculator":
     with col3:
         years = st.number_input("Investment Duration (years)", min_value=1, max_value=60, value=15, step=1)
 
+    # Everything the results depend on - stored results are shown only while these are unchanged
+    inputs = dict(
+        monthly_investment=int(monthly_investment),
+        rate=float(rate),
+        years=int(years),
+        inflation_rate=float(inflation_rate),
+        enable_increase=bool(enable_increase),
+        increase_frequency=increase_frequency,
+        increase_percentage=float(st.session_state.increase_percentage)
+    )
+
     if st.button("Calculate", type="primary", use_container_width=False):
         # Calculate with new parameters
-        df = calc.sip_calculator(
-            monthly_investment=int(monthly_investment), 
-            rate=float(rate), 
-            years=int(years),
-            inflation_rate=float(inflation_rate),
-            enable_increase=bool(enable_increase),
-            increase_frequency=increase_frequency,
-            increase_percentage=float(increase_percentage) if increase_percentage is not None else 0.0
-        )
+        df = _cached_sip(**inputs)
+
+        # Keep the results, and their Arrow form for st.dataframe, across reruns
+        st.session_state.sip_df = df
+        st.session_state.sip_arrow = pa.Table.from_pandas(df, preserve_index=False)
+        st.session_state.sip_inputs = inputs
+
+    if st.session_state.sip_inputs == inputs:
+        df = st.session_state.sip_df
 
         # 1. Display summary
-        investment_summary_block(df, calculator_type)
+        investment_summary_block(df, st.session_state.calculator_type)
 
         # 2. Display growth chart
         chart_cols = ["Final Amount", "Total Invested"]
         if enable_inflation and inflation_rate > 0:
             chart_cols.append("Real Value (Inflation Adjusted)")
 
-        st.plotly_chart(
+        st.vega_lite_chart(
             create_growth_chart(
                 df, 
                 chart_cols, 
@@ -232,11 +342,17 @@ elif calculator_type == "SIP Calculator":
         # 3. Display data table
         st.subheader("📈 Year-wise SIP Growth Details")
         # Remove the index column for cleaner display
-        df_display = df.copy()
-        st.dataframe(df_display, use_container_width=True, hide_index=True)
+        st.dataframe(st.session_state.sip_arrow, use_container_width=True, hide_index=True, column_config=_TABLE_COLUMN_CONFIG)
 
 
-elif calculator_type == "SWP Calculator":
+@st.fragment
+def _swp_fragment():
+    """SWP inputs, results and charts"""
+    enable_inflation = st.session_state.enable_inflation
+    inflation_rate = st.session_state.inflation_rate
+    enable_increase = st.session_state.enable_increase
+    increase_frequency = st.session_state.increase_frequency
+
     st.subheader("💸 SWP (Systematic Withdrawal Plan) Calculator")
 
     col1, col2, col3, col4 = st.columns(4)
@@ -249,28 +365,39 @@ elif calculator_type == "SWP Calculator":
     with col4:
         years = st.number_input("Duration (years)", min_value=1, max_value=60, value=10, step=1)
 
+    # Everything the results depend on - stored results are shown only while these are unchanged
+    inputs = dict(
+        initial_amount=int(initial_amount),
+        withdrawal_amount=int(withdrawal_amount),
+        rate=float(rate),
+        years=int(years),
+        inflation_rate=float(inflation_rate),
+        enable_increase=bool(enable_increase),
+        increase_frequency=increase_frequency,
+        increase_percentage=float(st.session_state.increase_percentage)
+    )
+
     if st.button("Calculate", type="primary", use_container_width=False):
         # Calculate with new parameters
-        df = calc.swp_calculator(
-            initial_amount=int(initial_amount), 
-            withdrawal_amount=int(withdrawal_amount),
-            rate=float(rate), 
-            years=int(years), 
-            inflation_rate=float(inflation_rate),
-            enable_increase=bool(enable_increase),
-            increase_frequency=increase_frequency,
-            increase_percentage=float(increase_percentage) if increase_percentage is not None else 0.0
-        )
+        df = _cached_swp(**inputs)
+
+        # Keep the results, and their Arrow form for st.dataframe, across reruns
+        st.session_state.swp_df = df
+        st.session_state.swp_arrow = pa.Table.from_pandas(df, preserve_index=False)
+        st.session_state.swp_inputs = inputs
+
+    if st.session_state.swp_inputs == inputs:
+        df = st.session_state.swp_df
 
         # 1. Display summary
-        investment_summary_block(df, calculator_type)
+        investment_summary_block(df, st.session_state.calculator_type)
 
         # 2. Display growth chart
         chart_cols = ["Remaining Balance", "Total Withdrawn"]
         if enable_inflation and inflation_rate > 0:
             chart_cols.append("Real Balance (Inflation Adjusted)")
 
-        st.plotly_chart(
+        st.vega_lite_chart(
             create_growth_chart(
                 df, 
                 chart_cols, 
@@ -282,8 +409,15 @@ elif calculator_type == "SWP Calculator":
         # 3. Display data table
         st.subheader("📈 Year-wise SWP Details")
         # Remove the index column for cleaner display
-        df_display = df.copy()
-        st.dataframe(df_display, use_container_width=True, hide_index=True)
+        st.dataframe(st.session_state.swp_arrow, use_container_width=True, hide_index=True, column_config=_TABLE_COLUMN_CONFIG)
+
+
+if calculator_type == "One Time Investment":
+    _oti_fragment()
+elif calculator_type == "SIP Calculator":
+    _sip_fragment()
+elif calculator_type == "SWP Calculator":
+    _swp_fragment()
 
 
 # Footer
@@ -1,5 +1,146 @@
 import pandas as pd
 import numpy as np
+from functools import lru_cache
+from math import pow as _pow
+from numba import njit, prange
+
+# Frequency labels from app.py (and their internal names) mapped to the step-up interval in years
+_FREQ_MAP = {
+    "Yearly": 1,
+    "Every 3 years": 3, 
+    "Every 5 years": 5,
+    "yearly": 1,
+    "every_3_years": 3,
+    "every_5_years": 5
+}
+
+
+def _step_interval(increase_frequency):
+    """Step-up interval in years for an increase_frequency value (0 if unrecognised)"""
+    return _FREQ_MAP.get(increase_frequency) or _FREQ_MAP.get(increase_frequency.lower(), 0)
+
+
+def _step_mask(years, step_every):
+    """Per-year flags for SIP/SWP step-ups: years 1 + step_every, 1 + 2*step_every, ..."""
+    step_mask = np.zeros(years, dtype=np.bool_)
+    if step_every:
+        step_mask[step_every::step_every] = True
+    return step_mask
+
+
+@njit(cache=True)
+def _annuity_factors(monthly_rate):
+    """
+    Yearly growth of a balance, and year-end value of 1 contributed at the start of
+    each of the 12 months, at monthly_rate (any sign; 0 means no growth)
+    """
+    growth = 1.0 + monthly_rate
+    growth_12 = growth ** 12
+    if monthly_rate == 0:
+        return growth_12, 12.0
+    return growth_12, (growth_12 - 1) / monthly_rate * growth
+
+
+# fastmath lets LLVM reassociate the multiply-add chains; figures may differ in the last ulp
+@njit(cache=True, fastmath=True)
+def _compound_core(initial, monthly_flow, monthly_rate, years, flow_is_withdrawal, step_mask, step_pct):
+    """
+    Monthly compounding with a monthly contribution (SIP, advanced a year at a time via
+    an annuity factor) or withdrawal (SWP, stepped month by month).
+    Returns per-year arrays of the monthly flow, flow in the year, closing balance and
+    cumulative flow. Withdrawals are capped at the balance and the run stops once the
+    corpus is exhausted, so the arrays are trimmed to the years simulated.
+    step_mask flags the years whose flow is stepped up by step_pct percent
+    """
+    monthly_flow_y = np.empty(years)
+    annual_flow_y = np.empty(years)
+    balance_y = np.empty(years)
+    total_flow_y = np.empty(years)
+
+    growth = 1.0 + monthly_rate
+    growth_12, annuity_unit = _annuity_factors(monthly_rate)
+    step_factor = 1.0 + step_pct/100
+    balance = initial
+    current_flow = monthly_flow
+    total_flow = 0.0
+    n = 0
+
+    for year in range(1, years + 1):
+        # Step-up applies from the start of the triggered year
+        if step_mask[year - 1]:
+            current_flow = current_flow * step_factor
+
+        if flow_is_withdrawal:
+            year_flow = 0.0
+            for month in range(12):
+                # Apply monthly growth, then withdraw at most what is left. Written as a
+                # select so the loop stays branch-free; an exhausted corpus withdraws 0
+                balance = balance * growth
+                flow = current_flow if balance >= current_flow else (balance if balance > 0 else 0.0)
+                balance -= flow
+                year_flow += flow
+            total_flow += year_flow
+        else:
+            # The contribution is constant within a year, so one annuity step replaces the month loop
+            year_flow = current_flow * 12
+            total_flow += year_flow
+            balance = balance * growth_12 + current_flow * annuity_unit
+
+        monthly_flow_y[year - 1] = current_flow
+        annual_flow_y[year - 1] = year_flow
+        balance_y[year - 1] = balance
+        total_flow_y[year - 1] = total_flow
+        n = year
+
+        if flow_is_withdrawal and balance <= 0:
+            break
+
+    return monthly_flow_y[:n], annual_flow_y[:n], balance_y[:n], total_flow_y[:n]
+
+
+@njit(parallel=True, cache=True, fastmath=True)
+def _sip_batch_core(monthly_investments, monthly_rates, years, step_mask, step_pct):
+    """
+    Year-end SIP balances for many (monthly investment, monthly rate) scenarios.
+    Years are the outer loop and scenarios the inner parallel loop, so each year's
+    annuity step runs as packed multiply-adds across scenarios
+    """
+    scenarios = monthly_investments.shape[0]
+
+    growth_12 = np.empty(scenarios)
+    annuity_unit = np.empty(scenarios)
+    for i in prange(scenarios):
+        growth_12[i], annuity_unit[i] = _annuity_factors(monthly_rates[i])
+
+    step_factor = 1.0 + step_pct/100
+    flow = monthly_investments.copy()
+    balance = np.zeros(scenarios)
+    balances = np.empty((years, scenarios))
+
+    for year in range(years):
+        step = step_factor if step_mask[year] else 1.0
+        for i in prange(scenarios):
+            flow[i] = flow[i] * step
+            balance[i] = balance[i] * growth_12[i] + flow[i] * annuity_unit[i]
+            balances[year, i] = balance[i]
+
+    return np.ascontiguousarray(balances.T)
+
+
+@lru_cache(maxsize=256)
+def _deflator(inflation_rate, years):
+    """Cumulative inflation factor for years 1..years (read-only, shared between calls)"""
+    deflator = np.power(1 + inflation_rate/100, np.arange(1, years + 1), dtype=np.float64)
+    deflator.flags.writeable = False
+    return deflator
+
+
+def _inflation_adjusted(nominal, inflation_rate):
+    """Deflate a nominal per-year series to today's value (all NaN when inflation is off)"""
+    if inflation_rate <= 0:
+        return np.full(len(nominal), np.nan)
+    return np.divide(nominal, _deflator(inflation_rate, len(nominal))).astype(np.int64)
+
 
 class MutualFundCalculator:
     def __init__(self):
@@ -11,60 +152,37 @@ class MutualFundCalculator:
         """
         Calculate one-time investment with compound interest and optional periodic increases
         """
-        results = []
-        current_amount = principal
-        total_principal = principal
-
-        # Convert increase_frequency to match expected values from app.py
-        freq_map = {
-            "Yearly": "yearly",
-            "Every 3 years": "every_3_years", 
-            "Every 5 years": "every_5_years",
-            "yearly": "yearly",
-            "every_3_years": "every_3_years",
-            "every_5_years": "every_5_years"
-        }
-        freq = freq_map.get(increase_frequency, increase_frequency.lower())
-
-        for year in range(1, years + 1):
-            # Check if we need to add additional investment this year
-            additional_investment = 0
-            if enable_increase and increase_amount > 0:
-                if freq == "yearly":
-                    additional_investment = increase_amount
-                elif freq == "every_3_years" and year % 3 == 0:
-                    additional_investment = increase_amount
-                elif freq == "every_5_years" and year % 5 == 0:
-                    additional_investment = increase_amount
-
-            # Add additional investment at the beginning of the year
-            current_amount += additional_investment
-            total_principal += additional_investment
-
-            # Apply compound interest
-            current_amount = current_amount * (1 + rate/100)
-
-            # Calculate real return after inflation adjustment
-            if inflation_rate > 0:
-                real_value = current_amount / ((1 + inflation_rate/100) ** year)
-            else:
-                real_value = current_amount
-
-            interest_earned = current_amount - total_principal
-            interest_percent = (interest_earned / total_principal) * 100 if total_principal > 0 else 0
-
-            results.append({
-                'Period': year,
-                'Year': 2025 + year,
-                'Total Principal': int(total_principal),
-                'Additional Investment': int(additional_investment),
-                'Final Amount': int(current_amount),
-                'Interest Earned': int(interest_earned),
-                'Interest Percent': round(interest_percent, 2),
-                'Real Value (Inflation Adjusted)': int(real_value) if inflation_rate > 0 else None
-            })
-
-        return pd.DataFrame(results)
+        period = np.arange(1, years + 1, dtype=np.int16)
+
+        # Additional investment lands at the beginning of every triggered year
+        additional_investment = np.zeros(years)
+        if enable_increase and increase_amount > 0:
+            step_every = _step_interval(increase_frequency)
+            if step_every:
+                additional_investment[step_every - 1::step_every] = increase_amount
+
+        # Closed-form compounding: each contribution grows from the start of its year
+        annual_growth = 1 + rate/100
+        growth = np.power(annual_growth, period)
+        current_amount = growth * (principal + np.cumsum(additional_investment * annual_growth / growth))
+        total_principal = principal + np.cumsum(additional_investment)
+
+        # Calculate real return after inflation adjustment
+        real_value = _inflation_adjusted(current_amount, inflation_rate)
+
+        interest_earned = current_amount - total_principal
+        interest_percent = np.divide(interest_earned, total_principal, out=np.zeros(years), where=total_principal > 0) * 100
+
+        return pd.DataFrame({
+            'Period': period,
+            'Year': 2025 + period,
+            'Total Principal': total_principal.astype(np.int64),
+            'Additional Investment': additional_investment.astype(np.int64),
+            'Final Amount': current_amount.astype(np.int64),
+            'Interest Earned': interest_earned.astype(np.int64),
+            'Interest Percent': interest_percent.round(2),
+            'Real Value (Inflation Adjusted)': real_value
+        })
 
     def sip_calculator(self, monthly_investment, rate, years, inflation_rate=0,
                       enable_increase=False, increase_frequency="yearly", 
@@ -72,62 +190,35 @@ class MutualFundCalculator:
         """
         Calculate SIP (Systematic Investment Plan) returns with optional periodic increases
         """
-        results = []
         monthly_rate = rate / (12 * 100)  # Monthly interest rate
-        total_invested = 0
-        current_value = 0
-        current_monthly_sip = monthly_investment
-
-        # Convert increase_frequency to match expected values from app.py
-        freq_map = {
-            "Yearly": "yearly",
-            "Every 3 years": "every_3_years", 
-            "Every 5 years": "every_5_years",
-            "yearly": "yearly",
-            "every_3_years": "every_3_years",
-            "every_5_years": "every_5_years"
-        }
-        freq = freq_map.get(increase_frequency, increase_frequency.lower())
-
-        for year in range(1, years + 1):
-            # Check if we need to increase SIP this year
-            if enable_increase and increase_percentage > 0:
-                if freq == "yearly":
-                    if year > 1:  # Don't increase in the first year
-                        current_monthly_sip = current_monthly_sip * (1 + increase_percentage/100)
-                elif freq == "every_3_years" and year > 1 and (year - 1) % 3 == 0:
-                    current_monthly_sip = current_monthly_sip * (1 + increase_percentage/100)
-                elif freq == "every_5_years" and year > 1 and (year - 1) % 5 == 0:
-                    current_monthly_sip = current_monthly_sip * (1 + increase_percentage/100)
-
-            year_invested = 0
-            for month in range(12):
-                total_invested += current_monthly_sip
-                year_invested += current_monthly_sip
-                current_value = (current_value + current_monthly_sip) * (1 + monthly_rate)
-
-            # Calculate real value after inflation adjustment
-            if inflation_rate > 0:
-                real_value = current_value / ((1 + inflation_rate/100) ** year)
-            else:
-                real_value = current_value
-
-            gains = current_value - total_invested
-            gains_percent = (gains / total_invested) * 100 if total_invested > 0 else 0
-
-            results.append({
-                'Period': year,
-                'Year': 2025 + year,
-                'Monthly SIP': int(current_monthly_sip),
-                'Annual Investment': int(year_invested),
-                'Total Invested': int(total_invested),
-                'Final Amount': int(current_value),
-                'Gains': int(gains),
-                'Gains Percent': round(gains_percent, 2),
-                'Real Value (Inflation Adjusted)': int(real_value) if inflation_rate > 0 else None
-            })
-
-        return pd.DataFrame(results)
+
+        # Step-up interval in years (0 = no step-up)
+        step_every = _step_interval(increase_frequency) if enable_increase and increase_percentage > 0 else 0
+
+        # Advanced a year at a time by the annuity step (an all-False mask for a constant SIP)
+        monthly_sip, annual_invested, current_value, total_invested = _compound_core(
+            0.0, float(monthly_investment), monthly_rate, years, False, _step_mask(years, step_every), float(increase_percentage)
+        )
+
+        period = np.arange(1, years + 1, dtype=np.int16)
+
+        # Calculate real value after inflation adjustment
+        real_value = _inflation_adjusted(current_value, inflation_rate)
+
+        gains = current_value - total_invested
+        gains_percent = np.divide(gains, total_invested, out=np.zeros(years), where=total_invested > 0) * 100
+
+        return pd.DataFrame({
+            'Period': period,
+            'Year': 2025 + period,
+            'Monthly SIP': monthly_sip.astype(np.int64),
+            'Annual Investment': annual_invested.astype(np.int64),
+            'Total Invested': total_invested.astype(np.int64),
+            'Final Amount': current_value.astype(np.int64),
+            'Gains': gains.astype(np.int64),
+            'Gains Percent': gains_percent.round(2),
+            'Real Value (Inflation Adjusted)': real_value
+        })
 
     def swp_calculator(self, initial_amount, withdrawal_amount, rate, years, inflation_rate=0,
                       enable_increase=False, increase_frequency="yearly", 
@@ -135,71 +226,74 @@ class MutualFundCalculator:
         """
         Calculate SWP (Systematic Withdrawal Plan) with optional periodic withdrawal increases
         """
-        results = []
         monthly_rate = rate / (12 * 100)
-        current_balance = initial_amount
-        total_withdrawn = 0
-        current_monthly_withdrawal = withdrawal_amount
-
-        # Convert increase_frequency to match expected values from app.py
-        freq_map = {
-            "Yearly": "yearly",
-            "Every 3 years": "every_3_years", 
-            "Every 5 years": "every_5_years",
-            "yearly": "yearly",
-            "every_3_years": "every_3_years",
-            "every_5_years": "every_5_years"
-        }
-        freq = freq_map.get(increase_frequency, increase_frequency.lower())
-
-        for year in range(1, years + 1):
-            # Check if we need to increase withdrawal this year
-            if enable_increase and increase_percentage > 0:
-                if freq == "yearly":
-                    if year > 1:  # Don't increase in the first year
-                        current_monthly_withdrawal = current_monthly_withdrawal * (1 + increase_percentage/100)
-                elif freq == "every_3_years" and year > 1 and (year - 1) % 3 == 0:
-                    current_monthly_withdrawal = current_monthly_withdrawal * (1 + increase_percentage/100)
-                elif freq == "every_5_years" and year > 1 and (year - 1) % 5 == 0:
-                    current_monthly_withdrawal = current_monthly_withdrawal * (1 + increase_percentage/100)
-
-            year_withdrawn = 0
-            for month in range(12):
-                if current_balance > 0:
-                    # Apply monthly growth
-                    current_balance = current_balance * (1 + monthly_rate)
-
-                    # Make withdrawal
-                    withdrawal = min(current_monthly_withdrawal, current_balance)
-                    current_balance -= withdrawal
-                    total_withdrawn += withdrawal
-                    year_withdrawn += withdrawal
-
-            # Calculate real value after inflation adjustment
-            if inflation_rate > 0:
-                real_balance = current_balance / ((1 + inflation_rate/100) ** year)
-                real_withdrawn = total_withdrawn / ((1 + inflation_rate/100) ** year)
-            else:
-                real_balance = current_balance
-                real_withdrawn = total_withdrawn
-
-            results.append({
-                'Period': year,
-                'Year': 2025 + year,
-                'Monthly Withdrawal': int(current_monthly_withdrawal),
-                'Annual Withdrawn': int(year_withdrawn),
-                'Remaining Balance': int(current_balance),
-                'Total Withdrawn': int(total_withdrawn),
-                'Real Balance (Inflation Adjusted)': int(real_balance) if inflation_rate > 0 else None
-            })
-
-            if current_balance <= 0:
-                break
-
-        return pd.DataFrame(results)
-
-    def calculate_cagr(self, initial_value, final_value, years):
+
+        # Step-up interval in years (0 = no step-up)
+        step_every = _step_interval(increase_frequency) if enable_increase and increase_percentage > 0 else 0
+
+        monthly_withdrawal, annual_withdrawn, current_balance, total_withdrawn = _compound_core(
+            float(initial_amount), float(withdrawal_amount), monthly_rate, years, True, _step_mask(years, step_every), float(increase_percentage)
+        )
+
+        # The core stops early once the corpus runs out
+        period = np.arange(1, len(current_balance) + 1, dtype=np.int16)
+
+        # Calculate real value after inflation adjustment
+        real_balance = _inflation_adjusted(current_balance, inflation_rate)
+
+        return pd.DataFrame({
+            'Period': period,
+            'Year': 2025 + period,
+            'Monthly Withdrawal': monthly_withdrawal.astype(np.int64),
+            'Annual Withdrawn': annual_withdrawn.astype(np.int64),
+            'Remaining Balance': current_balance.astype(np.int64),
+            'Total Withdrawn': total_withdrawn.astype(np.int64),
+            'Real Balance (Inflation Adjusted)': real_balance
+        })
+
+    def sip_batch(self, rates, monthly_investments, years, inflation_rate=0,
+                  enable_increase=False, increase_frequency="yearly",
+                  increase_percentage=0):
+        """
+        Year-end SIP values for several scenarios at once, one row per (rates[i], monthly_investments[i])
+        pair and one column per year (a scalar on either side is shared by all scenarios).
+        Scenarios run in parallel; values are inflation adjusted when inflation_rate > 0.
+        The parallel kernel is not thread-safe under Numba's default workqueue threading
+        layer, so don't call this from concurrent threads (e.g. several Streamlit sessions)
+        unless NUMBA_THREADING_LAYER is set to "tbb" or "omp"
+        """
+        # The kernel indexes both arrays per scenario, so pair them up front
+        # (a scalar on either side applies to every scenario)
+        try:
+            rates, monthly_investments = np.broadcast_arrays(
+                np.atleast_1d(np.asarray(rates, dtype=np.float64)),
+                np.atleast_1d(np.asarray(monthly_investments, dtype=np.float64)),
+            )
+        except ValueError:
+            raise ValueError(
+                f"rates and monthly_investments must have the same length, "
+                f"got {np.size(rates)} and {np.size(monthly_investments)}"
+            ) from None
+        if rates.ndim != 1:
+            raise ValueError("rates and monthly_investments must be scalars or 1-D sequences")
+        monthly_investments = np.ascontiguousarray(monthly_investments)
+        monthly_rates = rates / (12 * 100)
+
+        # Step-up interval in years (0 = no step-up)
+        step_every = _step_interval(increase_frequency) if enable_increase and increase_percentage > 0 else 0
+
+        balances = _sip_batch_core(
+            monthly_investments, monthly_rates, years, _step_mask(years, step_every), float(increase_percentage)
+        )
+
+        if inflation_rate > 0:
+            balances /= _deflator(inflation_rate, years)
+        return balances
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def calculate_cagr(initial_value, final_value, years):
         """Calculate Compound Annual Growth Rate"""
-        if initial_value <= 0 or final_value <= 0 or years <= 0:
+        if min(initial_value, final_value, years) <= 0:
             return 0
-        return ((final_value / initial_value) ** (1/years) - 1) * 100
\ No newline at end of file
+        return (_pow(final_value / initial_value, 1.0 / years) - 1.0) * 100.0
\ No newline at end of file
@@ -0,0 +1,53 @@
+import unittest
+
+import numpy as np
+
+from calculations import MutualFundCalculator
+
+
+class SipBatchTest(unittest.TestCase):
+    """sip_batch rows should match sip_calculator's Final Amount for the same inputs"""
+
+    def setUp(self):
+        self.calc = MutualFundCalculator()
+
+    def assert_matches_sip_calculator(self, rates, monthly_investments, years, **kwargs):
+        balances = self.calc.sip_batch(rates, monthly_investments, years, **kwargs)
+        self.assertEqual(balances.shape, (len(rates), years))
+        for i, (rate, monthly_investment) in enumerate(zip(rates, monthly_investments)):
+            df = self.calc.sip_calculator(monthly_investment, rate, years, **kwargs)
+            column = 'Real Value (Inflation Adjusted)' if kwargs.get('inflation_rate', 0) > 0 else 'Final Amount'
+            np.testing.assert_allclose(balances[i], df[column], atol=1)
+
+    def test_matches_sip_calculator(self):
+        rates = [-5.0, 0.0, 7.5, 12.0]
+        monthly_investments = [10000, 5000, 2500, 20000]
+        for inflation_rate in (0, 6):
+            for enable_increase in (False, True):
+                with self.subTest(inflation_rate=inflation_rate, enable_increase=enable_increase):
+                    self.assert_matches_sip_calculator(
+                        rates, monthly_investments, 15,
+                        inflation_rate=inflation_rate,
+                        enable_increase=enable_increase,
+                        increase_frequency="Every 3 years",
+                        increase_percentage=10,
+                    )
+
+    def test_scalar_broadcasts(self):
+        rates = [8.0, 10.0, 12.0]
+        by_rate = self.calc.sip_batch(rates, 10000, 10)
+        self.assertEqual(by_rate.shape, (3, 10))
+        np.testing.assert_array_equal(by_rate, self.calc.sip_batch(rates, [10000] * 3, 10))
+
+        by_amount = self.calc.sip_batch(12.0, [1000, 2000], 10)
+        np.testing.assert_array_equal(by_amount, self.calc.sip_batch([12.0, 12.0], [1000, 2000], 10))
+
+        self.assertEqual(self.calc.sip_batch(12.0, 10000, 10).shape, (1, 10))
+
+    def test_mismatched_lengths_raise(self):
+        with self.assertRaises(ValueError):
+            self.calc.sip_batch([10.0, 12.0], [1000, 2000, 3000, 4000], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()